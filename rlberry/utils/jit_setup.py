@@ -3,14 +3,24 @@
 # -> If so, use numba.jit
 # -> Otherwise, define numba_jit as a dummy decorator.
 #
+# numba_jit_cached also caches compiled functions on disk, so that they are
+# not recompiled every time a new process starts. It must only decorate
+# functions defined in a source file (not in exec'd code or `python -c`).
+#
+# fastmath is not enabled: it assumes no infinities, and functions such as
+# metric_lp compare their arguments to np.inf.
+#
 import rlberry.check_packages as check_packages
 
 if check_packages.NUMBA_INSTALLED:
     from numba import jit
 
     numba_jit = jit(nopython=True)
+    numba_jit_cached = jit(nopython=True, cache=True)
 else:
 
     def numba_jit(func, **options):
         """This decorator does not modify the decorated function."""
         return func
+
+    numba_jit_cached = numba_jit
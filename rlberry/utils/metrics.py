@@ -1,8 +1,8 @@
 import numpy as np
-from rlberry.utils.jit_setup import numba_jit
+from rlberry.utils.jit_setup import numba_jit_cached
 
 
-@numba_jit
+@numba_jit_cached
 def metric_lp(x, y, p, scaling):
     """
     Returns the p-norm:  || (x-y)/scaling||_p
@@ -24,12 +24,105 @@ def metric_lp(x, y, p, scaling):
     assert scaling.ndim == 1
 
     d = len(x)
-    diff = np.abs((x - y) / scaling)
+    # differences are accumulated coordinate by coordinate,
+    # to avoid allocating temporary arrays at each call
     # p = infinity
     if p == np.inf:
-        return diff.max()
+        tmp = 0.0
+        for ii in range(d):
+            diff = np.abs((x[ii] - y[ii]) / scaling[ii])
+            # propagate nan, as max() would drop it
+            if diff > tmp or np.isnan(diff):
+                tmp = diff
+        return tmp
+    # p = 2, avoid generic power calls
+    if p == 2:
+        tmp = 0.0
+        for ii in range(d):
+            diff = (x[ii] - y[ii]) / scaling[ii]
+            tmp += diff * diff
+        return np.sqrt(tmp)
     # p < infinity
-    tmp = 0
+    tmp = 0.0
     for ii in range(d):
-        tmp += np.power(diff[ii], p)
+        tmp += np.power(np.abs((x[ii] - y[ii]) / scaling[ii]), p)
     return np.power(tmp, 1.0 / p)
+
+
+@numba_jit_cached
+def metric_lp_vec(X, y, p, scaling):
+    """
+    Returns the p-norms || (X[ii]-y)/scaling||_p for all rows of X,
+    computed in a single call.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        2d array of shape (n, d)
+    y : numpy.ndarray
+        1d array of shape (d,)
+    p : int
+        norm parameter
+    scaling : numpy.ndarray
+        1d array of shape (d,)
+    """
+    assert p >= 1
+    assert X.ndim == 2
+    assert y.ndim == 1
+    assert scaling.ndim == 1
+
+    n, d = X.shape
+    dists = np.zeros(n)
+    for ii in range(n):
+        tmp = 0.0
+        # p = infinity
+        if p == np.inf:
+            for jj in range(d):
+                diff = np.abs((X[ii, jj] - y[jj]) / scaling[jj])
+                # propagate nan, as max() would drop it
+                if diff > tmp or np.isnan(diff):
+                    tmp = diff
+            dists[ii] = tmp
+        # p = 2, avoid generic power calls
+        elif p == 2:
+            for jj in range(d):
+                diff = (X[ii, jj] - y[jj]) / scaling[jj]
+                tmp += diff * diff
+            dists[ii] = np.sqrt(tmp)
+        # p < infinity
+        else:
+            for jj in range(d):
+                tmp += np.power(np.abs((X[ii, jj] - y[jj]) / scaling[jj]), p)
+            dists[ii] = np.power(tmp, 1.0 / p)
+    return dists
+
+
+@numba_jit_cached
+def metric_lp_matrix(X, p, scaling):
+    """
+    Returns the symmetric matrix of pairwise p-norms
+    D[ii, jj] = || (X[ii]-X[jj])/scaling||_p
+
+    Only the upper triangle is computed, the lower one is mirrored.
+    New rows can be appended to a cached matrix with metric_lp_vec.
+
+    Parameters
+    ----------
+    X : numpy.ndarray
+        2d array of shape (n, d)
+    p : int
+        norm parameter
+    scaling : numpy.ndarray
+        1d array of shape (d,)
+    """
+    assert X.ndim == 2
+
+    n = X.shape[0]
+    dists = np.zeros((n, n))
+    for ii in range(n):
+        for jj in range(ii + 1, n):
+            dists[ii, jj] = metric_lp(X[ii], X[jj], p, scaling)
+    for ii in range(n):
+        for jj in range(ii):
+            dists[ii, jj] = dists[jj, ii]
+    return dists
@@ -1,6 +1,6 @@
 import pytest
 import numpy as np
-from rlberry.utils.metrics import metric_lp
+from rlberry.utils.metrics import metric_lp, metric_lp_vec, metric_lp_matrix
 
 
 @pytest.mark.parametrize("dim", [1, 2, 3, 4])
@@ -15,3 +15,43 @@ def test_metrics(dim):
         assert (
             np.abs(metric_lp(x, y, p, scaling_2) - 2 * np.power(dim, 1.0 / p)) < 1e-15
         )
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3, 4])
+def test_metrics_vec(dim):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(10, dim))
+    y = rng.normal(size=dim)
+    scaling = rng.uniform(0.5, 2.0, size=dim)
+
+    for p in list(range(1, 10)) + [np.inf]:
+        dists = metric_lp_vec(X, y, p, scaling)
+        assert dists.shape == (10,)
+        for ii in range(10):
+            assert dists[ii] == metric_lp(X[ii], y, p, scaling)
+
+
+@pytest.mark.parametrize("dim", [1, 2, 3, 4])
+def test_metrics_matrix(dim):
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(10, dim))
+    scaling = rng.uniform(0.5, 2.0, size=dim)
+
+    for p in [1, 2, 3, np.inf]:
+        dists = metric_lp_matrix(X, p, scaling)
+        assert dists.shape == (10, 10)
+        assert np.array_equal(dists, dists.T)
+        for ii in range(10):
+            assert np.array_equal(dists[ii], metric_lp_vec(X, X[ii], p, scaling))
+
+
+@pytest.mark.parametrize("p", [1, 2, 3, np.inf])
+def test_metrics_nan(p):
+    x = np.array([1.0, 2.0])
+    y = np.array([1.0, np.nan])
+    scaling = np.ones(2)
+
+    assert np.isnan(metric_lp(x, y, p, scaling))
+    assert np.isnan(metric_lp(y, x, p, scaling))
+    assert np.isnan(metric_lp_vec(x[None, :], y, p, scaling)).all()
+    assert np.isnan(metric_lp_vec(np.array([[np.nan, 0.0]]), x, p, scaling)).all()
@@ -224,35 +224,26 @@ class DefaultWriter:
         """
         # Update data structures
         if tag not in self._data:
+            maxlen = self._maxlen_by_tag.get(tag, self._maxlen)
             self._data[tag] = dict()
-            self._data[tag]["name"] = deque(
-                maxlen=self._maxlen_by_tag.get(tag, self._maxlen)
-            )
-            self._data[tag]["tag"] = deque(
-                maxlen=self._maxlen_by_tag.get(tag, self._maxlen)
-            )
-            self._data[tag]["value"] = deque(
-                maxlen=self._maxlen_by_tag.get(tag, self._maxlen)
-            )
-            self._data[tag]["dw_time_elapsed"] = deque(
-                maxlen=self._maxlen_by_tag.get(tag, self._maxlen)
-            )
-            self._data[tag]["global_step"] = deque(
-                maxlen=self._maxlen_by_tag.get(tag, self._maxlen)
-            )
-
-        self._data[tag]["name"].append(
+            self._data[tag]["name"] = deque(maxlen=maxlen)
+            self._data[tag]["tag"] = deque(maxlen=maxlen)
+            self._data[tag]["value"] = deque(maxlen=maxlen)
+            self._data[tag]["dw_time_elapsed"] = deque(maxlen=maxlen)
+            self._data[tag]["global_step"] = deque(maxlen=maxlen)
+
+        tag_data = self._data[tag]
+        tag_data["name"].append(
             self._name
         )  # used in plots, when aggregating several writers
-        self._data[tag]["tag"].append(
-            tag
-        )  # useful to convert all data to a single DataFrame
-        self._data[tag]["value"].append(scalar_value)
-        self._data[tag]["dw_time_elapsed"].append(timer() - self._initial_time)
+        tag_data["tag"].append(tag)  # useful to convert all data to a single DataFrame
+        tag_data["value"].append(scalar_value)
+        t_now = timer()
+        tag_data["dw_time_elapsed"].append(t_now - self._initial_time)
         if global_step is None:
-            self._data[tag]["global_step"].append(np.nan)
+            tag_data["global_step"].append(np.nan)
         else:
-            self._data[tag]["global_step"].append(global_step)
+            tag_data["global_step"].append(global_step)
 
         # change _log_time
         if global_step is not None and self._log_time:
@@ -260,7 +251,7 @@ class DefaultWriter:
 
         # Log
         if (not self._log_time) and (self._print_log):
-            self._log()
+            self._log(t_now)
 
     def add_scalars(
         self,
@@ -304,9 +295,10 @@ class DefaultWriter:
             full_tag = str(main_tag) + "_" + str(tag) if str(main_tag) else str(tag)
             self._add_scalar(full_tag, scalar_value, global_step)
 
-    def _log(self):
-        # time since last log
-        t_now = timer()
+    def _log(self, t_now=None):
+        # time since last log, reusing the timestamp of the caller if given
+        if t_now is None:
+            t_now = timer()
         time_elapsed = t_now - self._time_last_log
         # log if enough time has passed since the last log
         max_global_step = 0